@@ -1,43 +1,517 @@
 #!/usr/bin/env python3
 import os
+import re
 import sys
-import json
+import asyncio
+import hashlib
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional
+
+import numpy as np
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
-from utils import get_response
+from utils import get_async_client, get_response_async, read_json, extract_json_from_end
+from generate_code import NON_OPTIMAL_MARKER
+
+# The objective is reported at the end of code_output.txt, which can be a multi-MB Gurobi log,
+# so only its tail is read; standard solver lines are parsed without calling the LLM
+CODE_OUTPUT_TAIL_BYTES = 8192
+OBJECTIVE_PATTERN = re.compile(
+    r'(?:Optimal objective|Best objective|Objective value)[:\s]+(-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?)',
+    re.IGNORECASE
+)
+
+# Columns of the results table: problem, status, expected objective, output objective, match
+ROW_FORMAT = "{:<15} {:<15} {:<20} {:<20} {:<10}"
+
+# On-disk cache of extracted objective values, keyed by the sha256 of the solver output
+EXTRACT_CACHE_PATH = Path.home() / ".cache" / "optimus" / "extract.sqlite"
+
+# Several solver outputs are sent per request, each tagged [#ID#]. All static text comes
+# before the outputs, and OpenAI only caches a shared prefix of at least 1024 tokens, so the
+# instructions and worked examples below are kept comfortably above that (roughly 1.4k tokens);
+# every request then reuses the cached prefix and only the solver outputs differ.
+EXTRACT_BATCH_SIZE = 15
+EXTRACT_MAX_CONCURRENCY = 20
+EXTRACT_BATCH_PROMPT_CACHE_KEY = "optimus-extract-batch-v1"
+EXTRACT_BATCH_PROMPT_PREFIX = """You are given several outputs of optimization programs and must extract the objective value of each.
+
+Each output is the text captured from running a generated Python script that builds and solves an
+optimization model with Gurobi (gurobipy). An output usually contains:
+- an optional "Optimal Revenue:" prefix added by the runner, which is NOT itself an objective value,
+- the Gurobi log: presolve statistics, the simplex or barrier iteration table, or the branch-and-bound
+  node table for mixed-integer problems, followed by a status line such as "Optimal objective ...",
+  "Best objective ..., best bound ..., gap ...", "Model is infeasible" or "Unbounded model",
+- the lines printed by the generated code itself, e.g. "Optimal Objective Value:  84.0".
+
+Rules:
+1. Return the final objective value of the solved model. If the output reports several values
+   (heuristic solutions, incumbents found during branch-and-bound, a value printed twice), use the
+   last reported optimal or best objective value.
+2. Values may be written in scientific notation (e.g. 1.150000000000e+05); convert them to plain
+   numbers (115000.0). Keep the sign: minimization and maximization problems can have negative
+   objectives.
+3. Ignore bounds, gaps, iteration counts, node counts, timings, coefficient ranges and any other
+   number that is not the objective value.
+4. If the solver stopped early (time limit, node limit, interrupted) but reports a best objective for
+   a feasible solution, return that best objective.
+5. If the model is infeasible, unbounded, infeasible or unbounded, or the script crashed before the
+   model was solved (a Python traceback, a Gurobi error, a missing license), use null.
+6. Never guess or compute a value that is not present in the output.
+
+Each solver output starts with a tag of the form [#ID#] on its own line. Return ONLY a JSON object
+mapping every ID to its numeric objective value (or null), with no other text, no markdown and no
+explanation. Include every ID exactly once.
+
+Example
+
+[#a#]
+Optimal Revenue: Gurobi Optimizer version 11.0.0 build v11.0.0rc2 (linux64 - "Ubuntu 22.04 LTS")
+Optimize a model with 3 rows, 2 columns and 6 nonzeros
+Coefficient statistics:
+  Matrix range     [1e+00, 4e+00]
+  Objective range  [3e+00, 5e+00]
+  Bounds range     [0e+00, 0e+00]
+  RHS range        [4e+00, 2e+01]
+Presolve time: 0.00s
+Presolved: 3 rows, 2 columns, 6 nonzeros
+
+Iteration    Objective       Primal Inf.    Dual Inf.      Time
+       0    4.5000000e+01   4.000000e+00   0.000000e+00      0s
+       2    8.4000000e+01   0.000000e+00   0.000000e+00      0s
+
+Solved in 2 iterations and 0.01 seconds (0.00 work units)
+Optimal objective  8.400000000e+01
+Optimal Objective Value:  84.0
+
+[#b#]
+Optimal Revenue: Gurobi Optimizer version 11.0.0 build v11.0.0rc2 (linux64 - "Ubuntu 22.04 LTS")
+Optimize a model with 12 rows, 9 columns and 40 nonzeros
+Variable types: 0 continuous, 9 integer (3 binary)
+Found heuristic solution: objective 98000.000000
+Presolve time: 0.00s
+
+    Nodes    |    Current Node    |     Objective Bounds      |     Work
+ Expl Unexpl |  Obj  Depth IntInf | Incumbent    BestBd   Gap | It/Node Time
+
+H    0     0                    112000.00000 120500.000  7.59%     -    0s
+*    0     0               0    115000.00000 115000.000  0.00%     -    0s
+
+Explored 1 nodes (12 simplex iterations) in 0.01 seconds (0.00 work units)
+Solution count 3: 115000 112000 98000
+
+Optimal solution found (tolerance 1.00e-04)
+Best objective 1.150000000000e+05, best bound 1.150000000000e+05, gap 0.0000%
+Optimal Objective Value:  115000.0
+
+[#c#]
+Optimal Revenue: Gurobi Optimizer version 11.0.0 build v11.0.0rc2 (linux64 - "Ubuntu 22.04 LTS")
+Optimize a model with 5 rows, 4 columns and 12 nonzeros
+Presolve removed 2 rows and 1 columns
+Presolve time: 0.00s
+
+Solved in 0 iterations and 0.00 seconds (0.00 work units)
+Infeasible model
+
+[#d#]
+Optimal Revenue: Gurobi Optimizer version 11.0.0 build v11.0.0rc2 (linux64 - "Ubuntu 22.04 LTS")
+Optimize a model with 240 rows, 180 columns and 1320 nonzeros
+Variable types: 60 continuous, 120 integer (120 binary)
+
+Explored 48211 nodes (503112 simplex iterations) in 600.02 seconds (512.44 work units)
+Solution count 4: -1532.5 -1498 -1410.25 -1200
+
+Time limit reached
+Best objective -1.532500000000e+03, best bound -1.561000000000e+03, gap 1.8597%
+
+[#e#]
+Traceback (most recent call last):
+  File "code.py", line 31, in <module>
+    model.addConstr(quicksum(Cost[i] * x[i] for i in range(NumItems)) <= Budget)
+NameError: name 'NumItems' is not defined
+
+[#f#]
+Optimal Revenue: Gurobi Optimizer version 11.0.0 build v11.0.0rc2 (linux64 - "Ubuntu 22.04 LTS")
+Optimize a model with 4 rows, 3 columns and 9 nonzeros
+Coefficient statistics:
+  Matrix range     [1e+00, 3e+00]
+  Objective range  [2e+00, 7e+00]
+  Bounds range     [0e+00, 0e+00]
+  RHS range        [5e+00, 3e+01]
+Presolve time: 0.00s
+
+Iteration    Objective       Primal Inf.    Dual Inf.      Time
+       0    6.0000000e+30   3.000000e+30   6.000000e+00      0s
+
+Solved in 1 iterations and 0.00 seconds (0.00 work units)
+Unbounded model
+Model status:  5
+
+Answer: {"a": 84.0, "b": 115000.0, "c": null, "d": -1532.5, "e": null, "f": null}
+
+Solver outputs:
+"""
+
+
+def _scan_subdirs(path):
+    """Return (name, path) pairs for the subdirectories of path, using the cached scandir entry types."""
+    with os.scandir(path) as it:
+        return [(e.name, e.path) for e in it if e.is_dir(follow_symlinks=False)]
+
+
+def _read_tail(path: Path, size: int = CODE_OUTPUT_TAIL_BYTES) -> str:
+    """Return the last size bytes of a file, decoded as text."""
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        f.seek(max(0, f.tell() - size))
+        return f.read().decode(errors='ignore')
+
+
+def _match_objective(text: str) -> Optional[float]:
+    """Return the last objective value reported in standard solver output, or None."""
+    matches = OBJECTIVE_PATTERN.findall(text)
+    return float(matches[-1]) if matches else None
+
+
+def _parse_output_solution(content: str):
+    """
+    Parse output_solution.txt written by the generated code.
+
+    Returns:
+        (objective, None) for an optimal solution, or (None, status) when the solver
+        reported a non-optimal Gurobi status code
+    """
+    tokens = content.split()
+    if tokens[0] == NON_OPTIMAL_MARKER:
+        return None, int(tokens[-1])
+    return float(tokens[-1]), None
+
+
+def _connect_extract_cache() -> sqlite3.Connection:
+    """Open the extraction cache, creating the database and table on first use."""
+    EXTRACT_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(EXTRACT_CACHE_PATH, timeout=30)
+    conn.execute("CREATE TABLE IF NOT EXISTS cache (sha256 TEXT PRIMARY KEY, value REAL)")
+    return conn
+
+
+def _cache_lookup(key: str) -> Optional[float]:
+    try:
+        conn = _connect_extract_cache()
+        try:
+            row = conn.execute("SELECT value FROM cache WHERE sha256=?", (key,)).fetchone()
+        finally:
+            conn.close()
+    except (OSError, sqlite3.Error):
+        return None
+    return row[0] if row else None
+
+
+def _cache_store(key: str, value: float) -> None:
+    try:
+        conn = _connect_extract_cache()
+        try:
+            conn.execute("INSERT OR REPLACE INTO cache (sha256, value) VALUES (?, ?)", (key, value))
+            conn.commit()
+        finally:
+            conn.close()
+    except (OSError, sqlite3.Error) as e:
+        print(f"  Warning: Failed to cache extracted objective: {e}")
 
 
 def extract_objective_from_code_output(code_output_content: str) -> Optional[float]:
     """
     Use GPT-4o-mini to extract objective value from code_output.txt.
 
+    This is the single-output case of extract_objectives_from_code_outputs and shares its
+    prompt and on-disk cache.
+
     Args:
         code_output_content: The content of code_output.txt
 
     Returns:
         Extracted objective value as float, or None if extraction fails
     """
-    prompt = f"""Extract the objective value from this optimization solver output.
-The output contains the result of running an optimization problem.
-Return ONLY the numeric objective value, nothing else. No text, no units, just the number.
+    return extract_objectives_from_code_outputs({"0": code_output_content})["0"]
+
+
+async def _extract_async(client, semaphore: asyncio.Semaphore, prompt: str) -> str:
+    async with semaphore:
+        return await get_response_async(client, prompt, model="gpt-4o-mini",
+                                        prompt_cache_key=EXTRACT_BATCH_PROMPT_CACHE_KEY)
 
-Solver output:
-{code_output_content}
 
-Return only the number (e.g., 84.0 or 115000.0):"""
+async def _extract_all_async(prompts: List[str], max_concurrency: int) -> List:
+    """Send all extraction prompts concurrently; failed requests are returned as exceptions."""
+    semaphore = asyncio.Semaphore(max_concurrency)
+    async with get_async_client("gpt-4o-mini") as client:
+        return await asyncio.gather(*[_extract_async(client, semaphore, prompt) for prompt in prompts],
+                                    return_exceptions=True)
+
+
+def extract_objectives_from_code_outputs(code_outputs: Dict[str, str],
+                                         batch_size: int = EXTRACT_BATCH_SIZE,
+                                         max_concurrency: int = EXTRACT_MAX_CONCURRENCY) -> Dict[str, Optional[float]]:
+    """
+    Use GPT-4o-mini to extract objective values from several code_output.txt files at once.
+
+    Outputs are sent in batches of batch_size per request, tagged with their ids; outputs
+    already in the on-disk cache are not sent at all. The requests run concurrently on one
+    event loop, at most max_concurrency at a time.
+
+    Args:
+        code_outputs: Mapping of id (e.g., problem name) to the content of its code_output.txt
+        batch_size: Number of solver outputs per request
+        max_concurrency: Maximum number of requests in flight
+
+    Returns:
+        Mapping of id to extracted objective value, or None if extraction failed
+    """
+    extracted = {}
+    keys = {}
+    pending = []
+    for output_id, content in code_outputs.items():
+        keys[output_id] = hashlib.sha256(content.encode()).hexdigest()
+        extracted[output_id] = _cache_lookup(keys[output_id])
+        if extracted[output_id] is None:
+            pending.append(output_id)
+
+    batches = [pending[start:start + batch_size] for start in range(0, len(pending), batch_size)]
+    prompts = [
+        EXTRACT_BATCH_PROMPT_PREFIX + "\n\n".join(
+            f"[#{output_id}#]\n{code_outputs[output_id]}" for output_id in batch
+        )
+        for batch in batches
+    ]
+    responses = asyncio.run(_extract_all_async(prompts, max_concurrency)) if prompts else []
+
+    for batch, response in zip(batches, responses):
+        try:
+            if isinstance(response, BaseException):
+                raise response
+            values = extract_json_from_end(response)
+        except Exception as e:
+            print(f"  Warning: Failed to extract objectives for {', '.join(batch)}: {e}")
+            continue
+
+        for output_id in batch:
+            try:
+                value = float(values[output_id])
+            except (KeyError, TypeError, ValueError):
+                print(f"  Warning: No objective value extracted for {output_id}")
+                continue
+            extracted[output_id] = value
+            _cache_store(keys[output_id], value)
+
+    return extracted
+
+
+def _record_output(outcome: Dict, expected_obj, output_obj: Optional[float], model_used: Optional[str],
+                   solver_status: Optional[int] = None) -> Dict:
+    """
+    Fill in the result row of a feasible problem once its output is known.
+
+    Rows with both an expected and an output objective are marked 'compare'; their match is
+    computed for all problems at once in analyze_optimus_data and their table line printed there.
+    """
+    problem_name = outcome['problem']
+    lines = outcome['lines']
+
+    # The solver ran but found no optimal solution
+    if solver_status is not None:
+        outcome['model_used'] = model_used
+        lines.append(ROW_FORMAT.format(problem_name, 'FEASIBLE', str(expected_obj), f'STATUS {solver_status}', 'NO'))
+        outcome['result'] = {
+            'problem': problem_name,
+            'status': 'feasible',
+            'expected_obj': expected_obj,
+            'output_obj': None,
+            'solver_status': solver_status,
+            'match': False
+        }
+        return outcome
+
+    if output_obj is None:
+        outcome['missing'] = True
+        lines.append(ROW_FORMAT.format(problem_name, 'FEASIBLE', str(expected_obj), 'MISSING', 'NO'))
+        outcome['result'] = {
+            'problem': problem_name,
+            'status': 'feasible',
+            'expected_obj': expected_obj,
+            'output_obj': None,
+            'match': False
+        }
+        return outcome
+
+    outcome['model_used'] = model_used
+
+    # Check if expected_obj is None
+    if expected_obj is None:
+        lines.append(ROW_FORMAT.format(problem_name, 'FEASIBLE', 'None', str(output_obj), 'NO'))
+        outcome['result'] = {
+            'problem': problem_name,
+            'status': 'feasible',
+            'expected_obj': expected_obj,
+            'output_obj': output_obj,
+            'match': False
+        }
+        return outcome
+
+    outcome['compare'] = True
+    outcome['result'] = {
+        'problem': problem_name,
+        'status': 'feasible',
+        'expected_obj': expected_obj,
+        'output_obj': output_obj,
+        'match': False
+    }
+    return outcome
+
 
+def _run_folder_pattern(model_type: str) -> re.Pattern:
+    """Compile the pattern matching run folder names (run_YYYYMMDD_{model_type})."""
+    return re.compile(rf"^run_\d{{8}}_{re.escape(model_type)}$")
+
+
+def _analyze_one(problem_dir: Path, model_type: str, model_name: str = None,
+                 run_pattern: Optional[re.Pattern] = None) -> Dict:
+    """
+    Analyze a single problem folder.
+
+    Args:
+        problem_dir: Path to the problem folder
+        model_type: Type of model run folder (e.g., 'google', 'qwen')
+        model_name: Specific model to analyze within the run folder, or None for all models
+        run_pattern: Compiled _run_folder_pattern(model_type), built here if not given
+
+    Returns:
+        Dictionary with the result row ('result', None if solution.json could not be read),
+        the counters the problem contributes to, the model that produced the output and
+        the table lines to print for it. If the objective still has to be extracted from
+        code_output.txt, 'pending' holds its content and the row is left unset.
+    """
+    problem_name = problem_dir.name
+    solution_file = problem_dir / "solution.json"
+    outcome = {
+        'problem': problem_name,
+        'result': None,
+        'infeasible': False,
+        'feasible': False,
+        'missing': False,
+        'compare': False,
+        'model_used': None,
+        'pending': None,
+        'expected_obj': None,
+        'lines': [],
+    }
+    lines = outcome['lines']
+
+    # Find the latest run folder (run_YYYYMMDD_{model_type})
+    if run_pattern is None:
+        run_pattern = _run_folder_pattern(model_type)
+    # Run folder names embed the date as YYYYMMDD, so the largest name is the latest run
+    latest_run = max(
+        ((name, path) for name, path in _scan_subdirs(problem_dir) if run_pattern.fullmatch(name)),
+        default=None
+    )
+
+    if latest_run is None:
+        outcome['missing'] = True
+        lines.append(ROW_FORMAT.format(problem_name, 'FEASIBLE', 'N/A', 'MISSING', 'NO'))
+        outcome['result'] = {
+            'problem': problem_name,
+            'status': 'feasible',
+            'expected_obj': None,
+            'output_obj': None,
+            'match': False
+        }
+        return outcome
+
+    latest_run_folder = Path(latest_run[1])
+
+    # Load solution.json; a missing file marks the problem as infeasible
     try:
-        response = get_response(prompt, model="gpt-4o-mini")
-        return float(response.strip())
+        solution_data = read_json(solution_file)
+        expected_obj = solution_data.get('objective')
+    except FileNotFoundError:
+        outcome['infeasible'] = True
+        lines.append(ROW_FORMAT.format(problem_name, 'INFEASIBLE', 'N/A', 'N/A', 'N/A'))
+        outcome['result'] = {
+            'problem': problem_name,
+            'status': 'infeasible',
+            'expected_obj': None,
+            'output_obj': None,
+            'match': False
+        }
+        return outcome
     except Exception as e:
-        print(f"  Warning: Failed to extract objective from code_output.txt: {e}")
-        return None
+        outcome['feasible'] = True
+        lines.append(ROW_FORMAT.format(problem_name, 'ERROR', 'ERROR', 'ERROR', 'N/A'))
+        lines.append(f"  Error reading solution.json: {e}")
+        return outcome
+
+    outcome['feasible'] = True
+
+    # Check output - o3 has output directly in run folder, others have subfolders
+    output_obj = None
+    solver_status = None
+    found_output = False
+    model_used = None
+
+    # First, check if output_solution.txt exists directly in run folder (o3 case)
+    direct_output_file = latest_run_folder / "output_solution.txt"
+    try:
+        output_obj, solver_status = _parse_output_solution(direct_output_file.read_text())
+        model_used = model_type  # Use model_type (e.g., 'o3') as the model name
+        found_output = True
+    except Exception as e:
+        pass
+
+    # If not found directly, check in subfolders (Google, Qwen case)
+    if not found_output:
+        if model_name:
+            models_to_check = [model_name]
+        else:
+            # Find all model folders in the run directory
+            models_to_check = [name for name, _ in _scan_subdirs(latest_run_folder)]
+
+        for model in models_to_check:
+            output_file = latest_run_folder / model / "output_solution.txt"
+            try:
+                output_obj, solver_status = _parse_output_solution(output_file.read_text())
+                model_used = model
+                found_output = True
+                break
+            except Exception as e:
+                continue
+
+    # Fallback: If output_solution.txt not found, parse the tail of code_output.txt. If no
+    # standard objective line is there, queue the tail for LLM extraction, which
+    # analyze_optimus_data runs in batches once all folders have been scanned
+    if not found_output:
+        code_output_file = latest_run_folder / "code_output.txt"
+        try:
+            code_output_tail = _read_tail(code_output_file)
+            output_obj = _match_objective(code_output_tail)
+            if output_obj is not None:
+                model_used = f"{model_type}_extracted"
+            else:
+                outcome['pending'] = code_output_tail
+                outcome['expected_obj'] = expected_obj
+                return outcome
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            lines.append(f"  Warning: Failed to read code_output.txt: {e}")
+
+    return _record_output(outcome, expected_obj, output_obj, model_used, solver_status)
 
 
-def analyze_optimus_data(base_path: str, model_type: str, model_name: str = None) -> Dict:
+def analyze_optimus_data(base_path: str, model_type: str, model_name: str = None, max_workers: int = 16) -> Dict:
     """
     Analyze OptiMUS dataset and calculate accuracy for a specific model.
 
@@ -46,6 +520,7 @@ def analyze_optimus_data(base_path: str, model_type: str, model_name: str = None
         model_type: Type of model run folder (e.g., 'google', 'qwen')
         model_name: Specific model to analyze within the run folder (e.g., 'gemini-2.5-flash')
                    If None, will analyze all models in the folder
+        max_workers: Number of threads used to analyze problem folders in parallel
 
     Returns:
         Dictionary containing analysis results
@@ -55,174 +530,74 @@ def analyze_optimus_data(base_path: str, model_type: str, model_name: str = None
     results = []
     infeasible_count = 0
     feasible_count = 0
-    accurate_count = 0
     missing_output = 0
     missing_indices = []
     model_outputs = {}  # Track which models produced outputs
 
     # Get all problem folders (numeric only)
     problem_dirs = sorted(
-        [d for d in base_dir.iterdir() if d.is_dir() and d.name.isdigit()],
+        [Path(path) for name, path in _scan_subdirs(base_dir) if name.isdigit()],
         key=lambda x: int(x.name)
     )
-    print(f"\nAnalyzing {model_type.upper()} Model(s)")
-    print(f"Found {len(problem_dirs)} problem folders\n")
-    print("=" * 120)
-    print(f"{'Problem':<15} {'Status':<15} {'Expected Obj':<20} {'Output Obj':<20} {'Match':<10}")
-    print("=" * 120)
-
-    for problem_dir in problem_dirs:
-        problem_name = problem_dir.name
-        solution_file = problem_dir / "solution.json"
-
-        # Find the latest run folder (run_YYYYMMDD_{model_type})
-        run_folders = sorted(
-            [d for d in problem_dir.iterdir()
-             if d.is_dir() and d.name.startswith("run_") and d.name.endswith(f"_{model_type}")],
-            reverse=True
-        )
 
-        if not run_folders:
+    # Problems are independent I/O (and possibly HTTP) work, so overlap them in threads.
+    # map() keeps the problem order, so the table below is printed sorted by problem id.
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        analyze_one = partial(_analyze_one, model_type=model_type, model_name=model_name,
+                              run_pattern=_run_folder_pattern(model_type))
+        outcomes = list(executor.map(analyze_one, problem_dirs))
+
+    # Extract objectives from code_output.txt in batches instead of one request per problem
+    pending = {outcome['problem']: outcome['pending'] for outcome in outcomes if outcome['pending'] is not None}
+    if pending:
+        extracted = extract_objectives_from_code_outputs(pending)
+        for outcome in outcomes:
+            if outcome['pending'] is not None:
+                _record_output(outcome, outcome['expected_obj'], extracted.get(outcome['problem']),
+                               f"{model_type}_extracted")
+
+    # Compare expected and output objectives for all problems in one vectorized pass
+    compared = [outcome for outcome in outcomes if outcome['compare']]
+    expected = np.array([float(outcome['result']['expected_obj']) for outcome in compared], dtype=float)
+    output = np.array([float(outcome['result']['output_obj']) for outcome in compared], dtype=float)
+    matches = np.abs(expected - output) < 0.1
+    accurate_count = int(matches.sum())
+    for outcome, match in zip(compared, matches.tolist()):
+        outcome['result']['match'] = match
+
+    # The table is collected and written in one go rather than with a print per line
+    table_rows = [
+        f"\nAnalyzing {model_type.upper()} Model(s)",
+        f"Found {len(problem_dirs)} problem folders\n",
+        "=" * 120,
+        ROW_FORMAT.format('Problem', 'Status', 'Expected Obj', 'Output Obj', 'Match'),
+        "=" * 120,
+    ]
+
+    for outcome in outcomes:
+        table_rows.extend(outcome['lines'])
+        if outcome['compare']:
+            result = outcome['result']
+            match_str = "YES" if result['match'] else "NO"
+            table_rows.append(ROW_FORMAT.format(result['problem'], 'FEASIBLE', str(result['expected_obj']),
+                                                str(result['output_obj']), match_str))
+
+        infeasible_count += outcome['infeasible']
+        feasible_count += outcome['feasible']
+        if outcome['missing']:
             missing_output += 1
-            missing_indices.append(int(problem_name))
-            print(f"{problem_name:<15} {'FEASIBLE':<15} {'N/A':<20} {'MISSING':<20} {'NO':<10}")
-            results.append({
-                'problem': problem_name,
-                'status': 'feasible',
-                'expected_obj': None,
-                'output_obj': None,
-                'match': False
-            })
-            continue
+            missing_indices.append(int(outcome['problem']))
+        if outcome['model_used'] is not None:
+            model_used = outcome['model_used']
+            model_outputs[model_used] = model_outputs.get(model_used, 0) + 1
+        if outcome['result'] is not None:
+            results.append(outcome['result'])
 
-        latest_run_folder = run_folders[0]
-
-        # Check if solution.json exists
-        if not solution_file.exists():
-            infeasible_count += 1
-            print(f"{problem_name:<15} {'INFEASIBLE':<15} {'N/A':<20} {'N/A':<20} {'N/A':<10}")
-            results.append({
-                'problem': problem_name,
-                'status': 'infeasible',
-                'expected_obj': None,
-                'output_obj': None,
-                'match': False
-            })
-            continue
-
-        feasible_count += 1
-
-        # Load solution.json
-        try:
-            with open(solution_file, 'r') as f:
-                solution_data = json.load(f)
-            expected_obj = solution_data.get('objective')
-        except Exception as e:
-            print(f"{problem_name:<15} {'ERROR':<15} {'ERROR':<20} {'ERROR':<20} {'N/A':<10}")
-            print(f"  Error reading solution.json: {e}")
-            continue
-
-        # Check output - o3 has output directly in run folder, others have subfolders
-        output_obj = None
-        found_output = False
-        model_used = None
-
-        # First, check if output_solution.txt exists directly in run folder (o3 case)
-        direct_output_file = latest_run_folder / "output_solution.txt"
-        if direct_output_file.exists():
-            try:
-                with open(direct_output_file, 'r') as f:
-                    output_content = f.read().strip()
-                output_obj = float(output_content.split()[-1])
-                model_used = model_type  # Use model_type (e.g., 'o3') as the model name
-                model_outputs[model_type] = model_outputs.get(model_type, 0) + 1
-                found_output = True
-            except Exception as e:
-                pass
-
-        # If not found directly, check in subfolders (Google, Qwen case)
-        if not found_output:
-            if model_name:
-                models_to_check = [model_name]
-            else:
-                # Find all model folders in the run directory
-                models_to_check = [d.name for d in latest_run_folder.iterdir() if d.is_dir()]
-
-            for model in models_to_check:
-                output_file = latest_run_folder / model / "output_solution.txt"
-                if output_file.exists():
-                    try:
-                        with open(output_file, 'r') as f:
-                            output_content = f.read().strip()
-                        output_obj = float(output_content.split()[-1])
-                        model_used = model
-                        if model not in model_outputs:
-                            model_outputs[model] = 0
-                        model_outputs[model] += 1
-                        found_output = True
-                        break
-                    except Exception as e:
-                        continue
-
-        # Fallback: If output_solution.txt not found, try extracting from code_output.txt
-        if not found_output:
-            code_output_file = latest_run_folder / "code_output.txt"
-            if code_output_file.exists():
-                try:
-                    with open(code_output_file, 'r') as f:
-                        code_output_content = f.read()
-                    extracted_obj = extract_objective_from_code_output(code_output_content)
-                    if extracted_obj is not None:
-                        output_obj = extracted_obj
-                        model_used = f"{model_type}_extracted"
-                        model_outputs[model_used] = model_outputs.get(model_used, 0) + 1
-                        found_output = True
-                except Exception as e:
-                    print(f"  Warning: Failed to read code_output.txt: {e}")
-
-        if not found_output:
-            missing_output += 1
-            missing_indices.append(int(problem_name))
-            print(f"{problem_name:<15} {'FEASIBLE':<15} {str(expected_obj):<20} {'MISSING':<20} {'NO':<10}")
-            results.append({
-                'problem': problem_name,
-                'status': 'feasible',
-                'expected_obj': expected_obj,
-                'output_obj': None,
-                'match': False
-            })
-            continue
-
-        # Check if expected_obj is None
-        if expected_obj is None:
-            print(f"{problem_name:<15} {'FEASIBLE':<15} {'None':<20} {str(output_obj):<20} {'NO':<10}")
-            results.append({
-                'problem': problem_name,
-                'status': 'feasible',
-                'expected_obj': expected_obj,
-                'output_obj': output_obj,
-                'match': False
-            })
-            continue
-
-        # Compare
-        match = abs(float(expected_obj) - float(output_obj)) < 0.1
-        if match:
-            accurate_count += 1
-
-        match_str = "YES" if match else "NO"
-        print(f"{problem_name:<15} {'FEASIBLE':<15} {str(expected_obj):<20} {str(output_obj):<20} {match_str:<10}")
-
-        results.append({
-            'problem': problem_name,
-            'status': 'feasible',
-            'expected_obj': expected_obj,
-            'output_obj': output_obj,
-            'match': match
-        })
+    table_rows.append("=" * 120)
+    sys.stdout.write("\n".join(table_rows))
+    sys.stdout.write("\n")
 
     # Summary statistics
-    print("=" * 120)
     print("\nSummary Statistics:")
     print(f"  Total problems:      {len(problem_dirs)}")
     print(f"  Infeasible:          {infeasible_count}")
@@ -245,7 +620,10 @@ def analyze_optimus_data(base_path: str, model_type: str, model_name: str = None
         print(f"\nMismatches ({len(mismatches)}):")
         print("-" * 120)
         for r in mismatches:
-            print(f"  {r['problem']}: Expected {r['expected_obj']}, Got {r['output_obj']}")
+            if r.get('solver_status') is not None:
+                print(f"  {r['problem']}: Expected {r['expected_obj']}, Got STATUS {r['solver_status']}")
+            else:
+                print(f"  {r['problem']}: Expected {r['expected_obj']}, Got {r['output_obj']}")
 
     # Show missing indices
     if missing_indices:
@@ -1,6 +1,8 @@
 import os
+import sys
 import numpy as np
 import json
+import importlib.util
 from utils import get_response
 import subprocess
 
@@ -38,16 +40,48 @@ def extract_code(text):
     return code
 
 
+def get_compiled_code(code_path):
+    """
+    Return the path of the bytecode compiled for code_path by generate_code, or None if
+    there is none or it no longer matches the source.
+    """
+    pyc_path = importlib.util.cache_from_source(code_path)
+    try:
+        with open(pyc_path, "rb") as f:
+            header = f.read(16)
+        with open(code_path, "rb") as f:
+            source = f.read()
+    except OSError:
+        return None
+    # Hash-based pyc header: magic number, flags, source hash (PEP 552)
+    if header[:4] != importlib.util.MAGIC_NUMBER or header[8:16] != importlib.util.source_hash(source):
+        return None
+    return os.path.abspath(pyc_path)
+
+
 def execute_code(dir, code_filename):
     try:
         code_path = os.path.join(dir, code_filename)
+        # A script run directly is always re-parsed, so run its compiled bytecode when it is
+        # up to date. Every attempt runs under this interpreter, which compiled the bytecode.
+        pyc_path = get_compiled_code(code_path)
+        command = [sys.executable, pyc_path or code_filename]
+        env = None
+        if pyc_path:
+            # The bytecode runs from __pycache__, which becomes sys.path[0]; put the run
+            # directory on the path too so imports next to the script still resolve
+            python_path = [os.path.abspath(dir)]
+            if os.environ.get("PYTHONPATH"):
+                python_path.append(os.environ["PYTHONPATH"])
+            env = dict(os.environ, PYTHONPATH=os.pathsep.join(python_path))
         # Using Python's subprocess to execute the code as a separate process
         result = subprocess.run(
-            ["python", code_filename],
+            command,
             capture_output=True,
             text=True,
             check=True,
             cwd=dir,
+            env=env,
         )
         # save result in a file
         with open(os.path.join(dir, "code_output.txt"), "w") as f:
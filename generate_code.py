@@ -1,6 +1,14 @@
+import io
 import os
+import py_compile
 import numpy as np
 import json
+from functools import lru_cache
+from typing import Optional
+from utils import read_json
+
+# Written to output_solution.txt, followed by the Gurobi status code, when no optimal solution is found
+NON_OPTIMAL_MARKER = "NON_OPTIMAL"
 
 
 def get_var_code(symbol, shape, type, definition, solver="gurobipy"):
@@ -11,22 +19,24 @@ def get_var_code(symbol, shape, type, definition, solver="gurobipy"):
                 f'{symbol} = model.addVar(vtype=GRB.{type.upper()}, name="{symbol}")\n'
             )
         else:
-            return (
-                f"{symbol} = model.addVars("
-                + ", ".join([str(i) for i in shape])
-                + f', vtype=GRB.{type.upper()}, name="{symbol}")\n'
-            )
+            return f'{symbol} = model.addVars({", ".join(map(str, shape))}, vtype=GRB.{type.upper()}, name="{symbol}")\n'
     else:
         raise NotImplementedError(f"Solver {solver} is not implemented")
 
 
-def get_param_code(symbol, shape, definition):
-    return f'{symbol} = data["{symbol}"] # shape: {shape}, definition: {definition}\n'
+@lru_cache(maxsize=None)
+def _load_problem_info(problem_dir: str) -> Optional[dict]:
+    """Parse problem_dir/problem_info.json once per process; None if the file does not exist."""
+    path = os.path.join(problem_dir, "problem_info.json")
+    if not os.path.exists(path):
+        return None
+    return read_json(path)
 
 
 def generate_code(state, dir, problem_dir=None):
-    code = []
-    code.append(
+    # Sections are written to a single buffer, one newline after each
+    code = io.StringIO()
+    code.write(
         f"""
 import os
 import numpy as np
@@ -41,26 +51,24 @@ with open("data.json", "r") as f:
 
 """
     )
-    problem_info = None
-    if problem_dir and os.path.exists(os.path.join(problem_dir, "problem_info.json")):
-        with open(os.path.join(problem_dir, "problem_info.json"), "r") as f:
-            problem_info = json.load(f)
+    problem_info = _load_problem_info(os.fspath(problem_dir)) if problem_dir else None
+    pi_params = (problem_info or {}).get("parameters", {})
 
-    code.append("\n\n### Define the parameters\n")
+    code.write("\n\n\n### Define the parameters\n\n")
     for symbol, v in state["parameters"].items():
-        print(v)
         # Use ground truth from problem_info.json if available, otherwise use state
-        if problem_info and "parameters" in problem_info and symbol in problem_info["parameters"]:
-            shape = problem_info["parameters"][symbol]["shape"]
-            definition = problem_info["parameters"][symbol]["description"]
+        info = pi_params.get(symbol)
+        if info:
+            shape = info["shape"]
+            definition = info["description"]
         else:
             shape = v["shape"]
             definition = v["definition"]
-        code.append(get_param_code(symbol, shape, definition))
+        code.write(f'{symbol} = data["{symbol}"] # shape: {shape}, definition: {definition}\n\n')
 
-    code.append("\n\n### Define the variables\n")
+    code.write("\n\n### Define the variables\n\n")
     for symbol, v in state["variables"].items():
-        code.append(
+        code.write(
             get_var_code(
                 symbol,
                 v["shape"],
@@ -69,34 +77,45 @@ with open("data.json", "r") as f:
                 solver="gurobipy",
             )
         )
+        code.write("\n")
 
-    code.append("\n\n### Define the constraints\n")
+    code.write("\n\n### Define the constraints\n\n")
     for c in state["constraints"]:
-        code.append(c["code"])
+        code.write(c["code"])
+        code.write("\n")
 
-    code.append("\n\n### Define the objective\n")
-    code.append(state["objective"]["code"])
+    code.write("\n\n### Define the objective\n\n")
+    code.write(state["objective"]["code"])
 
-    code.append("\n\n### Optimize the model\n")
-    code.append("model.optimize()\n")
+    code.write("\n\n\n### Optimize the model\n\n")
+    code.write("model.optimize()\n")
 
-    code.append("\n\n### Output optimal objective value\n")
-    code.append(f'print("Optimal Objective Value: ", model.objVal)\n')
+    # Save the optimal value if it exists, otherwise the solver status. model.objVal is only
+    # read when the model is optimal, since it raises for infeasible models.
+    code.write("\n\n\n### Output optimal objective value\n")
+    code.write(
+        f"""
 
-    # code to save the optimal value if it exists
-    code.append(
-        """
 if model.status == GRB.OPTIMAL:
     with open("output_solution.txt", "w") as f:
         f.write(str(model.objVal))
     print("Optimal Objective Value: ", model.objVal)
 else:
     with open("output_solution.txt", "w") as f:
-        f.write(model.status)
+        f.write(f"{NON_OPTIMAL_MARKER} {{model.status}}")
+    print("Model status: ", model.status)
 """
     )
 
-    code_str = "\n".join(code)
-
-    with open(os.path.join(dir, "code.py"), "w") as f:
-        f.write(code_str)
+    code_path = os.path.join(dir, "code.py")
+    with open(code_path, "wb") as f:
+        f.write(code.getvalue().encode())
+
+    # Byte-compile once; execute_code runs the cached bytecode while it matches code.py
+    try:
+        # Record the absolute path so tracebacks still show the source when run from another cwd
+        py_compile.compile(code_path, dfile=os.path.abspath(code_path), doraise=True,
+                           invalidation_mode=py_compile.PycInvalidationMode.CHECKED_HASH)
+    except py_compile.PyCompileError:
+        # Syntax errors surface when code.py is executed and are fixed by execute_and_debug
+        pass
@@ -1,16 +1,20 @@
 import os
+import copy
 import time
 import json
 import argparse
+import sys
 import glob
-from concurrent.futures import ThreadPoolExecutor
+import subprocess
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 
 from parameters import get_params
 from constraint import get_constraints
 from constraint_model import get_constraint_formulations
 from target_code import get_codes
 from generate_code import generate_code
-from utils import load_state, save_state, Logger
+from utils import save_state, write_json, Logger
 from objective import get_objective
 from objective_model import get_objective_formulation
 from execute_code import execute_and_debug
@@ -19,8 +23,21 @@ from rag.rag_utils import RAGMode
 import litellm
 litellm.suppress_debug_info = True
 
-def process_single_dir(dir, devmode=1, rag_mode=None, error_correction=True, model="gpt-4o"):
+def get_git_hash():
+    """Return the current git commit hash, or an empty string if it cannot be determined."""
+    try:
+        result = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=False)
+    except OSError:
+        return ""
+    return result.stdout.strip()
+
+
+def process_single_dir(dir, devmode=1, rag_mode=None, error_correction=True, model="gpt-4o", git_hash=None):
     """Process a single directory through the optimization pipeline."""
+    # State checkpoints are only written for inspection; write them in the background
+    # while the pipeline carries on with the in-memory state
+    io_pool = ThreadPoolExecutor(max_workers=2)
+    checkpoints = []
     try:
         # Read the params state
         DEV_MODE = devmode
@@ -31,8 +48,8 @@ def process_single_dir(dir, devmode=1, rag_mode=None, error_correction=True, mod
         if DEV_MODE:
             run_dir = os.path.join(dir, f"run_{time.strftime('%Y%m%d')}_{MODEL}")
         else:
-            # Get git hash
-            git_hash = os.popen("git rev-parse HEAD").read().strip()
+            if git_hash is None:
+                git_hash = get_git_hash()
             run_dir = os.path.join(dir, f"run_{time.strftime('%Y%m%d')}_{MODEL}_{git_hash}_RAG")
 
         if not os.path.exists(run_dir):
@@ -48,7 +65,7 @@ def process_single_dir(dir, devmode=1, rag_mode=None, error_correction=True, mod
         print(f"Description: {state.get('description', 'N/A')}")
         print(f"{'='*80}\n")
     
-        save_state(state, os.path.join(run_dir, "state_1_params.json"))
+        checkpoints.append(io_pool.submit(save_state, copy.deepcopy(state), os.path.join(run_dir, "state_1_params.json")))
 
         # Save parameter values to data.json for code execution
         data = {}
@@ -56,14 +73,12 @@ def process_single_dir(dir, devmode=1, rag_mode=None, error_correction=True, mod
             if "value" in param_data:
                 data[param_name] = param_data["value"]
 
-        with open(os.path.join(run_dir, "data.json"), "w") as f:
-            json.dump(data, f, indent=4)
+        write_json(data, os.path.join(run_dir, "data.json"))
 
         logger = Logger(f"{run_dir}/log.txt")
         logger.reset()
 
         # # ###### Get objective
-        state = load_state(os.path.join(run_dir, "state_1_params.json"))
         objective = get_objective(
             state["description"],
             state["parameters"],
@@ -75,10 +90,9 @@ def process_single_dir(dir, devmode=1, rag_mode=None, error_correction=True, mod
         )
         print(f"[{dir}] Objective: {objective}")
         state["objective"] = objective
-        save_state(state, os.path.join(run_dir, "state_2_objective.json"))
+        checkpoints.append(io_pool.submit(save_state, copy.deepcopy(state), os.path.join(run_dir, "state_2_objective.json")))
         # #######
         # # # ####### Get constraints
-        state = load_state(os.path.join(run_dir, "state_2_objective.json"))
         constraints = get_constraints(
             state["description"],
             state["parameters"],
@@ -90,10 +104,9 @@ def process_single_dir(dir, devmode=1, rag_mode=None, error_correction=True, mod
         )
         print(f"[{dir}] Constraints: {constraints}")
         state["constraints"] = constraints
-        save_state(state, os.path.join(run_dir, "state_3_constraints.json"))
+        checkpoints.append(io_pool.submit(save_state, copy.deepcopy(state), os.path.join(run_dir, "state_3_constraints.json")))
         # # # #######
         # ####### Get constraint formulations
-        state = load_state(os.path.join(run_dir, "state_3_constraints.json"))
         constraints, variables = get_constraint_formulations(
             state["description"],
             state["parameters"],
@@ -106,10 +119,9 @@ def process_single_dir(dir, devmode=1, rag_mode=None, error_correction=True, mod
         )
         state["constraints"] = constraints
         state["variables"] = variables
-        save_state(state, os.path.join(run_dir, "state_4_constraints_modeled.json"))
+        checkpoints.append(io_pool.submit(save_state, copy.deepcopy(state), os.path.join(run_dir, "state_4_constraints_modeled.json")))
         #######
         # ####### Get objective formulation
-        state = load_state(os.path.join(run_dir, "state_4_constraints_modeled.json"))
         objective = get_objective_formulation(
             state["description"],
             state["parameters"],
@@ -122,11 +134,10 @@ def process_single_dir(dir, devmode=1, rag_mode=None, error_correction=True, mod
         )
         state["objective"] = objective
         print(f"[{dir}] DONE OBJECTIVE FORMULATION")
-        save_state(state, os.path.join(run_dir, "state_5_objective_modeled.json"))
+        checkpoints.append(io_pool.submit(save_state, copy.deepcopy(state), os.path.join(run_dir, "state_5_objective_modeled.json")))
         # #######
 
         # # ####### Get codes
-        state = load_state(os.path.join(run_dir, "state_5_objective_modeled.json"))
         constraints, objective = get_codes(
             state["description"],
             state["parameters"],
@@ -138,18 +149,23 @@ def process_single_dir(dir, devmode=1, rag_mode=None, error_correction=True, mod
         )
         state["constraints"] = constraints
         state["objective"] = objective
-        save_state(state, os.path.join(run_dir, "state_6_code.json"))
+        checkpoints.append(io_pool.submit(save_state, copy.deepcopy(state), os.path.join(run_dir, "state_6_code.json")))
         # # #######
 
         ####### Run the code
-        state = load_state(os.path.join(run_dir, "state_6_code.json"))
         generate_code(state, run_dir, problem_dir=dir)
         execute_and_debug(state, model=MODEL, dir=run_dir, logger=logger)
         #######
 
+        # Surface any checkpoint write errors
+        for checkpoint in checkpoints:
+            checkpoint.result()
+
         return f"Successfully processed {dir}"
     except Exception as e:
         return f"Error processing {dir}: {str(e)}"
+    finally:
+        io_pool.shutdown()
 
 
 if __name__ == "__main__":
@@ -169,55 +185,54 @@ if __name__ == "__main__":
     parser.add_argument("--error-correction", type=int, default=1, help="Enable error correction (1=True, 0=False)")
     args = parser.parse_args()
 
+    # Problems run in worker processes so the Python-side pipeline work is not serialized
+    # by the GIL; forking avoids re-importing the pipeline modules in every worker
+    if sys.platform.startswith("linux"):
+        mp.set_start_method("fork")
+
     # Read the params state
     DEV_MODE = args.devmode
     RAG_MODE = args.rag_mode
     ERROR_CORRECTION = bool(args.error_correction)
     MODEL = args.model
+    # The commit is the same for every problem, so look it up once for the whole run
+    GIT_HASH = get_git_hash() if not DEV_MODE else None
 
     if args.missing:
         # Process hardcoded list of problems with MISSING output
         dirs = [os.path.join(args.data_path, str(problem_id)) for problem_id in MISSING_PROBLEM_IDS]
         print(f"Processing {len(dirs)} problems with MISSING output: {MISSING_PROBLEM_IDS}")
 
-        # Create process arguments
-        process_args = [
-            (dir, DEV_MODE, RAG_MODE, ERROR_CORRECTION, MODEL)
-            for dir in dirs
-        ]
-
-        # Process in parallel
-        with ThreadPoolExecutor(max_workers=args.num_workers) as executor:
-            results = list(executor.map(lambda args: process_single_dir(*args), process_args))
+        # Process in parallel, reporting each directory as soon as it finishes
+        with ProcessPoolExecutor(max_workers=args.num_workers) as executor:
+            futures = [
+                executor.submit(process_single_dir, dir, DEV_MODE, RAG_MODE, ERROR_CORRECTION, MODEL, GIT_HASH)
+                for dir in dirs
+            ]
+            for future in as_completed(futures):
+                print(future.result())
 
-        # Print results
         print("\n" + "="*80)
         print("PROCESSING COMPLETE")
         print("="*80)
-        for result in results:
-            print(result)
     elif args.all_dirs:
         # Get all directories under the data path
         dirs = sorted([d for d in glob.glob(os.path.join(args.data_path, "*")) if os.path.isdir(d)])
         print(f"Found {len(dirs)} directories to process")
 
-        # Create process arguments
-        process_args = [
-            (dir, DEV_MODE, RAG_MODE, ERROR_CORRECTION, MODEL)
-            for dir in dirs
-        ]
-
-        # Process in parallel
-        with ThreadPoolExecutor(max_workers=args.num_workers) as executor:
-            results = list(executor.map(lambda args: process_single_dir(*args), process_args))
+        # Process in parallel, reporting each directory as soon as it finishes
+        with ProcessPoolExecutor(max_workers=args.num_workers) as executor:
+            futures = [
+                executor.submit(process_single_dir, dir, DEV_MODE, RAG_MODE, ERROR_CORRECTION, MODEL, GIT_HASH)
+                for dir in dirs
+            ]
+            for future in as_completed(futures):
+                print(future.result())
 
-        # Print results
         print("\n" + "="*80)
         print("PROCESSING COMPLETE")
         print("="*80)
-        for result in results:
-            print(result)
     else:
         if not args.dir:
             parser.error("Either --dir, --all-dirs, or --missing must be specified")
-        process_single_dir(args.dir, DEV_MODE, RAG_MODE, ERROR_CORRECTION, MODEL)
+        process_single_dir(args.dir, DEV_MODE, RAG_MODE, ERROR_CORRECTION, MODEL, GIT_HASH)
@@ -1,10 +1,18 @@
 import os
 import json
-from groq import Groq
+import math
+import re
+from pathlib import Path
+from groq import Groq, AsyncGroq
 import openai
 from dotenv import load_dotenv
 load_dotenv()
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 groq_key = "###"
 openai_key = "###"
 openai_org = "###"
@@ -131,15 +139,93 @@ def get_response(prompt, model="llama3-70b-8192"):
     return res
 
 
+def get_async_client(model="llama3-70b-8192"):
+    """
+    Create an async client for model, to be used with get_response_async.
+
+    Async clients hold connections tied to the running event loop, so create one per
+    event loop and close it there (e.g., with "async with get_async_client(model) as client").
+    """
+    if model == "llama3-70b-8192":
+        return AsyncGroq(api_key=groq_key)
+    return openai.AsyncClient(api_key=os.getenv("OPENAI_API_KEY"), base_url=os.getenv("OPENAI_API_BASE"))
+
+
+async def get_response_async(client, prompt, model="llama3-70b-8192", prompt_cache_key=None):
+    """Async counterpart of get_response, sending the request through client."""
+    extra_kwargs = {}
+    if prompt_cache_key and model != "llama3-70b-8192":
+        extra_kwargs["extra_body"] = {"prompt_cache_key": prompt_cache_key}
+    chat_completion = await client.chat.completions.create(
+        messages=[
+            {
+                "role": "user",
+                "content": prompt,
+            }
+        ],
+        model=model,
+        **extra_kwargs,
+    )
+
+    res = chat_completion.choices[0].message.content
+    return res
+
+
+# A run of 20+ digits may be an integer beyond 64 bits, which orjson silently reads as a float
+_LONG_DIGITS = re.compile(rb"\d{20,}")
+
+
+def read_json(path):
+    """Parse a JSON file, using orjson when it is installed."""
+    content = Path(path).read_bytes()
+    if orjson is not None and not _LONG_DIGITS.search(content):
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # orjson rejects the NaN/Infinity literals that json.dump writes; let json parse those
+            pass
+    return json.loads(content)
+
+
+def _has_non_finite(obj):
+    """Return True if obj contains a NaN or infinite float anywhere."""
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_has_non_finite(v) for v in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_non_finite(v) for v in obj)
+    return False
+
+
+def write_json(obj, path):
+    """
+    Write obj to path as indented JSON, using orjson when it is installed.
+
+    Objects orjson cannot represent faithfully are written with json instead: NaN and
+    Infinity, which orjson writes as null, and integers beyond 64 bits, which it refuses
+    (both show up in big-M values parsed from model replies).
+    """
+    if orjson is not None and not _has_non_finite(obj):
+        try:
+            content = orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            content = None
+        if content is not None:
+            with open(path, "wb") as f:
+                f.write(content)
+            return
+
+    with open(path, "w") as f:
+        json.dump(obj, f, indent=4)
+
+
 def load_state(state_file):
-    with open(state_file, "r") as f:
-        state = json.load(f)
-    return state
+    return read_json(state_file)
 
 
 def save_state(state, dir):
-    with open(dir, "w") as f:
-        json.dump(state, f, indent=4)
+    write_json(state, dir)
 
 
 def shape_string_to_list(shape_string):